@@ -1,10 +1,18 @@
 import streamlit as st
 import requests
+import urllib3
+import aiohttp
+import asyncio
+import time
+import threading
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
 import json
+import ijson
 
 # Set page config
 st.set_page_config(
@@ -31,88 +39,365 @@ time_options = {
 selected_time = st.sidebar.selectbox("Time Range:", list(time_options.keys()), index=2)
 
 # Magnitude filter
+class MagFilter(IntEnum):
+    """Magnitude filter passed to the fetch functions, independent of the display labels"""
+    ALL = 0
+    SIG = 1
+    M45 = 2
+    M25 = 3
+    M10 = 4
+
+# Minimum magnitude sent to the API for each threshold filter
+MIN_MAGNITUDES = {
+    MagFilter.M45: 4.5,
+    MagFilter.M25: 2.5,
+    MagFilter.M10: 1.0
+}
+
 magnitude_options = {
-    "All Earthquakes": "all",
-    "Significant Earthquakes": "significant",
-    "M4.5+ Earthquakes": "4.5",
-    "M2.5+ Earthquakes": "2.5",
-    "M1.0+ Earthquakes": "1.0"
+    "All Earthquakes": MagFilter.ALL,
+    "Significant Earthquakes": MagFilter.SIG,
+    "M4.5+ Earthquakes": MagFilter.M45,
+    "M2.5+ Earthquakes": MagFilter.M25,
+    "M1.0+ Earthquakes": MagFilter.M10
 }
 selected_magnitude = st.sidebar.selectbox("Magnitude:", list(magnitude_options.keys()), index=2)
 
 # Maximum number of results
 max_results = st.sidebar.slider("Maximum Results:", min_value=10, max_value=1000, value=100, step=10)
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def fetch_earthquake_data(time_period, magnitude, limit):
-    """Fetch earthquake data from USGS API"""
-    
-    # Build API URL
-    base_url = "https://earthquake.usgs.gov/fdsnws/event/1/query"
-    
+# GeoJSON property columns (as flattened by json_normalize) and their DataFrame names
+PROPERTY_COLUMNS = {
+    "properties_mag": "magnitude",
+    "properties_place": "place",
+    "properties_time": "time",
+    "properties_url": "url",
+    "properties_tsunami": "tsunami",
+    "properties_sig": "significance",
+    "properties_alert": "alert",
+    "properties_felt": "felt",
+    "properties_cdi": "cdi",
+    "properties_mmi": "mmi"
+}
+
+# Above this many points the map shows grid-aggregated markers instead of raw events
+MAP_CLUSTER_THRESHOLD = 500
+MAP_GRID_DEGREES = 2.0
+
+PERIOD_DELTAS = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(days=7),
+    "month": timedelta(days=30)
+}
+
+USGS_QUERY_URL = "https://earthquake.usgs.gov/fdsnws/event/1/query"
+REQUEST_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "eq-explorer/1.0"
+}
+
+# Prefetch attempts expire on the same schedule as the fetch cache
+PREFETCH_TTL = 300
+
+# fetch_earthquake_data caches what it serves for another TTL, so only hand over recent payloads
+PREFETCH_MAX_AGE = 60
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session so USGS requests reuse the pooled keep-alive connection"""
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    return session
+
+@st.cache_resource
+def get_prefetch_store():
+    """Process-wide prefetch state keyed by (time_period, mag_filter, limit)"""
+    return {
+        "lock": threading.Lock(),
+        "attempts": {},  # key -> monotonic time of the last fetch or prefetch attempt
+        "payloads": {}   # key -> (monotonic fetch time, payload) awaiting fetch_earthquake_data
+    }
+
+def build_query_params(time_period, mag_filter, limit):
+    """Build the USGS API query parameters"""
     params = {
         "format": "geojson",
+        "eventtype": "earthquake",
         "limit": limit,
         "orderby": "time"
     }
     
-    # Add time parameter
-    if time_period != "all":
-        params["starttime"] = (datetime.now() - timedelta(days=30 if time_period == "month" else 7 if time_period == "week" else 1 if time_period == "day" else 1/24)).isoformat()
+    # Add time parameter (the API interprets naive timestamps as UTC)
+    delta = PERIOD_DELTAS.get(time_period)
+    if delta:
+        params["starttime"] = (datetime.now(timezone.utc).replace(tzinfo=None) - delta).isoformat()
     
     # Add magnitude parameter
-    if magnitude != "all" and magnitude != "significant":
-        params["minmagnitude"] = float(magnitude)
-    elif magnitude == "significant":
-        # For significant earthquakes, we'll filter after fetching
-        pass
+    if mag_filter is MagFilter.SIG:
+        # USGS threshold for significant earthquakes, applied server-side
+        params["minsig"] = 600
+    elif mag_filter in MIN_MAGNITUDES:
+        params["minmagnitude"] = MIN_MAGNITUDES[mag_filter]
+    
+    return params
+
+@st.cache_data(ttl=300)  # Cache for 5 minutes
+def fetch_earthquake_data(time_period, mag_filter, limit):
+    """Fetch earthquake data from USGS API"""
+    
+    # Whatever this returns lands in the fetch cache, so the prefetcher can skip the key
+    store = get_prefetch_store()
+    key = (time_period, mag_filter, limit)
+    with store["lock"]:
+        store["attempts"][key] = time.monotonic()
+        fetched_at, data = store["payloads"].pop(key, (0, None))
+    
+    # Serve a payload speculatively fetched by prefetch_neighboring_periods
+    if data is not None and time.monotonic() - fetched_at < PREFETCH_MAX_AGE:
+        return data
+    
+    params = build_query_params(time_period, mag_filter, limit)
     
     try:
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        with get_session().get(USGS_QUERY_URL, params=params, stream=True, timeout=10) as response:
+            response.raise_for_status()
+            
+            # Parse features incrementally while the body is still downloading
+            response.raw.decode_content = True
+            features = list(ijson.items(response.raw, 'features.item', use_float=True))
+        return {"features": features}
+    except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError) as e:
         st.error(f"Error fetching data: {str(e)}")
         return None
 
-def process_earthquake_data(data):
+async def _fetch(session, params):
+    async with session.get(USGS_QUERY_URL, params=params) as response:
+        response.raise_for_status()
+        
+        # Same incremental parse and payload shape as fetch_earthquake_data
+        features = [feature async for feature in ijson.items_async(response.content, 'features.item', use_float=True)]
+        return {"features": features}
+
+async def _fetch_many(params_list):
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(headers=REQUEST_HEADERS, timeout=timeout) as session:
+        return await asyncio.gather(*(_fetch(session, params) for params in params_list), return_exceptions=True)
+
+def _prefetch_worker(store, keys, params_list):
+    results = asyncio.run(_fetch_many(params_list))
+    now = time.monotonic()
+    with store["lock"]:
+        # Drop payloads that expired without being used
+        payloads = store["payloads"]
+        for stale in [key for key, (fetched_at, _) in payloads.items() if now - fetched_at >= PREFETCH_MAX_AGE]:
+            del payloads[stale]
+        
+        for key, result in zip(keys, results):
+            # Failed prefetches are dropped; the attempt time stops them being retried until it expires
+            if not isinstance(result, Exception):
+                payloads[key] = (now, result)
+
+def prefetch_neighboring_periods(time_period, mag_filter, limit):
+    """Fetch the adjacent time ranges in the background so switching to them is instant"""
+    store = get_prefetch_store()
+    now = time.monotonic()
+    
+    periods = list(time_options.values())
+    index = periods.index(time_period)
+    keys = [
+        (period, mag_filter, limit)
+        for period in periods[max(index - 1, 0):index + 2]
+        if period != time_period
+    ]
+    
+    # Skip keys fetched, prefetched or attempted within the TTL, and claim the rest
+    with store["lock"]:
+        attempts = store["attempts"]
+        keys = [key for key in keys if key not in attempts or now - attempts[key] >= PREFETCH_TTL]
+        for key in keys:
+            attempts[key] = now
+    if not keys:
+        return
+    
+    # Run off the script thread so the prefetch never delays the next rerun
+    params_list = [build_query_params(*key) for key in keys]
+    threading.Thread(target=_prefetch_worker, args=(store, keys, params_list), daemon=True).start()
+
+# Cached on data_key; the leading underscore keeps Streamlit from hashing the raw GeoJSON
+@st.cache_data(ttl=300)
+def process_earthquake_data(data_key, _data):
     """Process the earthquake data into a pandas DataFrame"""
-    if not data or 'features' not in data:
+    if not _data or not _data.get('features'):
         return pd.DataFrame()
     
-    earthquakes = []
-    for feature in data['features']:
-        props = feature['properties']
-        coords = feature['geometry']['coordinates']
-        
-        earthquake = {
-            'magnitude': props.get('mag'),
-            'place': props.get('place'),
-            'time': datetime.fromtimestamp(props.get('time', 0) / 1000),
-            'longitude': coords[0] if len(coords) > 0 else None,
-            'latitude': coords[1] if len(coords) > 1 else None,
-            'depth': coords[2] if len(coords) > 2 else None,
-            'url': props.get('url'),
-            'tsunami': props.get('tsunami', 0),
-            'significance': props.get('sig', 0),
-            'alert': props.get('alert'),
-            'felt': props.get('felt', 0),
-            'cdi': props.get('cdi'),
-            'mmi': props.get('mmi')
-        }
-        earthquakes.append(earthquake)
+    features = pd.json_normalize(_data['features'], sep='_')
+    features = features.reindex(columns=features.columns.union(['properties_mag', 'geometry_coordinates']))
+    
+    # Skip features with missing magnitude or a [lon, lat, depth] triple using a single mask
+    # (.str.len() is NaN for null geometries, so those fail the comparison too)
+    valid = features['properties_mag'].notna() & (features['geometry_coordinates'].astype(object).str.len() == 3)
+    features = features[valid]
+    coords = np.asarray(features['geometry_coordinates'].tolist(), dtype=float).reshape(-1, 3)
+    
+    # Null values inside an otherwise complete triple are rare, so only slice again when present
+    finite = np.isfinite(coords[:, :2]).all(axis=1)
+    if not finite.all():
+        features, coords = features[finite], coords[finite]
     
-    df = pd.DataFrame(earthquakes)
+    # Rename the flattened GeoJSON property columns in one pass
+    df = features.reindex(columns=list(PROPERTY_COLUMNS)).rename(columns=PROPERTY_COLUMNS)
+    df['time'] = pd.to_datetime(df['time'], unit='ms')
     
-    # Filter out rows with missing magnitude or coordinates
-    df = df.dropna(subset=['magnitude', 'longitude', 'latitude'])
+    # Split the [lon, lat, depth] coordinate triples into columns
+    df[['longitude', 'latitude', 'depth']] = coords
+    df = df[['magnitude', 'place', 'time', 'longitude', 'latitude', 'depth', 'url',
+             'tsunami', 'significance', 'alert', 'felt', 'cdi', 'mmi']]
     
-    # Filter for significant earthquakes if selected
-    if selected_magnitude == "Significant Earthquakes":
-        df = df[df['significance'] >= 600]  # USGS threshold for significant earthquakes
+    # Arrow-backed strings match the Arrow IPC that Streamlit uses to ship tables to the frontend
+    df = df.astype({'place': 'string[pyarrow]', 'url': 'string[pyarrow]', 'alert': 'string[pyarrow]'})
     
     return df
 
+def aggregate_map_points(df, grid_degrees=MAP_GRID_DEGREES):
+    """Bucket earthquakes into a coarse lat/lon grid with one row per occupied cell"""
+    edges = np.arange(-180, 180 + grid_degrees, grid_degrees)
+    lat_bin = pd.cut(df['latitude'], bins=edges, include_lowest=True).rename('lat_bin')
+    lon_bin = pd.cut(df['longitude'], bins=edges, include_lowest=True).rename('lon_bin')
+    
+    return df.groupby([lat_bin, lon_bin], observed=True).agg(
+        latitude=('latitude', 'mean'),
+        longitude=('longitude', 'mean'),
+        magnitude=('magnitude', 'max'),
+        count=('magnitude', 'size')
+    ).reset_index(drop=True)
+
+# Trimmed modebar shared by every chart
+PLOTLY_CONFIG = {
+    "displaylogo": False,
+    "modeBarButtonsToRemove": ["lasso2d", "select2d", "autoScale2d", "toggleSpikelines"],
+    "scrollZoom": True
+}
+
+# A fixed uirevision keeps zoom/pan state across reruns instead of resetting the view
+INTERACTION_LAYOUT = dict(hovermode="closest", uirevision="static")
+
+def round_for_plot(df):
+    """Trim float precision for the figures (~1 m at 5 decimal places) to shrink the payload"""
+    return df.assign(
+        latitude=df['latitude'].round(5),
+        longitude=df['longitude'].round(5),
+        depth=df['depth'].round(2),
+        magnitude=df['magnitude'].round(2)
+    )
+
+def na_to_none(series):
+    """Object array with None for missing values, since Plotly's orjson encoder can't serialize pd.NA"""
+    return series.astype(object).where(series.notna(), None).to_numpy()
+
+# Figure builders are cached on fig_key; the leading underscore keeps Streamlit from hashing the DataFrame
+@st.cache_data(ttl=300)
+def build_map_fig(fig_key, _df):
+    """Build the earthquake location map"""
+    # Collapse large result sets into one marker per grid cell, rounding the cell means
+    if len(_df) > MAP_CLUSTER_THRESHOLD:
+        points = aggregate_map_points(_df).round({'latitude': 5, 'longitude': 5, 'magnitude': 2})
+        marker_size = np.clip(6 + 3 * np.sqrt(points['count']), 6, 30)
+        hover_text = points['count'].astype(str) + " earthquakes"
+        hover_template = "<b>%{text}</b><br>Max magnitude: %{marker.color:.1f}<extra></extra>"
+    else:
+        points = round_for_plot(_df)
+        marker_size = np.clip(4 + 2 * points['magnitude'], 4, 20)
+        hover_text = na_to_none(points['place'])
+        hover_template = "<b>%{text}</b><br>Magnitude: %{marker.color:.1f}<extra></extra>"
+
+    fig = go.Figure(go.Scattermapbox(
+        lat=points['latitude'],
+        lon=points['longitude'],
+        mode="markers",
+        marker=dict(
+            size=marker_size,
+            color=points['magnitude'],
+            colorscale="Reds",
+            showscale=True,
+            colorbar=dict(title="Magnitude")
+        ),
+        text=hover_text,
+        hovertemplate=hover_template
+    ))
+    
+    fig.update_layout(
+        title="Earthquake Locations and Magnitudes",
+        mapbox=dict(
+            style="open-street-map",
+            zoom=1,
+            center=dict(lat=points['latitude'].mean(), lon=points['longitude'].mean())
+        ),
+        height=600,
+        margin={"r":0,"t":50,"l":0,"b":0},
+        **INTERACTION_LAYOUT
+    )
+    
+    return fig
+
+@st.cache_data(ttl=300)
+def build_histogram_fig(fig_key, _df):
+    """Build the magnitude distribution histogram"""
+    # Bin on the server so the trace carries 30 bars instead of every magnitude
+    counts, edges = np.histogram(_df['magnitude'].values, bins=30)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        hovertemplate="Magnitude: %{x:.2f}<br>Number of Earthquakes: %{y}<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Magnitude Distribution",
+        xaxis_title="Magnitude",
+        yaxis_title="Number of Earthquakes",
+        bargap=0,
+        **INTERACTION_LAYOUT
+    )
+    
+    return fig
+
+@st.cache_data(ttl=300)
+def build_scatter_fig(fig_key, _df):
+    """Build the depth vs magnitude scatter plot"""
+    return px.scatter(
+        round_for_plot(_df), 
+        x="depth", 
+        y="magnitude",
+        hover_name=na_to_none(_df['place']),
+        title="Depth vs Magnitude",
+        labels={'depth': 'Depth (km)', 'magnitude': 'Magnitude'}
+    ).update_layout(**INTERACTION_LAYOUT)
+
+@st.cache_data(ttl=300)
+def build_timeline_fig(fig_key, _df):
+    """Build the magnitude timeline"""
+    # Order the plotted arrays by argsorting the int64 timestamps instead of sorting the DataFrame
+    order = np.argsort(_df['time'].values.view('i8'), kind='stable')
+    magnitude = _df['magnitude'].round(2).values[order]
+    return px.scatter(
+        x=_df['time'].values[order], 
+        y=magnitude,
+        size=magnitude,
+        hover_name=na_to_none(_df['place'])[order],
+        title="Earthquakes Over Time",
+        labels={'x': 'Time', 'y': 'Magnitude', 'size': 'Magnitude'}
+    ).update_layout(**INTERACTION_LAYOUT)
+
+@st.cache_data(ttl=300)
+def build_summary_stats(fig_key, _df):
+    """Summarize magnitude, depth and significance"""
+    return _df[['magnitude', 'depth', 'significance']].describe()
+
+@st.cache_data(ttl=300)
+def _to_csv_bytes(df):
+    """Encode the table as CSV once per unique dataset"""
+    return df.to_csv(index=False, date_format='%Y-%m-%d %H:%M:%S').encode('utf-8')
+
 # Fetch and process data
 with st.spinner("Fetching earthquake data..."):
     earthquake_data = fetch_earthquake_data(
@@ -122,7 +407,17 @@ with st.spinner("Fetching earthquake data..."):
     )
 
 if earthquake_data:
-    df = process_earthquake_data(earthquake_data)
+    # Query arguments plus a cheap payload fingerprint (event count and newest event id),
+    # so a refreshed payload is reprocessed even if the filters are unchanged
+    features = earthquake_data.get('features') or []
+    data_key = (
+        time_options[selected_time],
+        magnitude_options[selected_magnitude],
+        max_results,
+        len(features),
+        features[0].get('id') if features else None
+    )
+    df = process_earthquake_data(data_key, earthquake_data)
     
     if not df.empty:
         # Display summary statistics
@@ -139,104 +434,63 @@ if earthquake_data:
             st.metric("Average Magnitude", f"{avg_mag:.1f}")
         
         with col4:
-            recent_count = len(df[df['time'] > datetime.now() - timedelta(hours=24)])
+            cutoff = pd.Timestamp.now(tz='UTC').tz_localize(None) - pd.Timedelta(hours=24)
+            recent_count = int((df['time'].values > np.datetime64(cutoff)).sum())
             st.metric("Last 24 Hours", recent_count)
         
-        # Create tabs for different visualizations
-        tab1, tab2, tab3, tab4 = st.tabs(["🗺️ Map", "📊 Charts", "📋 Data Table", "ℹ️ Details"])
+        # Filter state plus a data fingerprint, so figures are rebuilt only when either changes
+        fig_key = (
+            time_options[selected_time],
+            magnitude_options[selected_magnitude],
+            max_results,
+            len(df),
+            df['time'].max().isoformat()
+        )
         
-        with tab1:
+        # Only the selected view runs, so hidden views don't pay for building their figures
+        view_options = ["🗺️ Map", "📊 Charts", "📋 Data Table", "ℹ️ Details"]
+        active_tab = st.radio("View", view_options, horizontal=True, key="active_tab", label_visibility="collapsed")
+        
+        if active_tab == "🗺️ Map":
             st.subheader("Earthquake Locations")
             
             # Create map visualization
             if not df.empty:
-                fig = px.scatter_mapbox(
-                    df, 
-                    lat="latitude", 
-                    lon="longitude",
-                    size="magnitude",
-                    color="magnitude",
-                    hover_name="place",
-                    hover_data={
-                        "magnitude": True,
-                        "depth": ":.1f",
-                        "time": True,
-                        "latitude": ":.3f",
-                        "longitude": ":.3f"
-                    },
-                    color_continuous_scale="Reds",
-                    size_max=20,
-                    zoom=1,
-                    mapbox_style="open-street-map",
-                    title="Earthquake Locations and Magnitudes"
-                )
-                
-                fig.update_layout(
-                    height=600,
-                    margin={"r":0,"t":50,"l":0,"b":0}
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
+                fig = build_map_fig(fig_key, df)
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
         
-        with tab2:
+        elif active_tab == "📊 Charts":
             st.subheader("Earthquake Analysis")
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # Magnitude distribution
-                fig_hist = px.histogram(
-                    df, 
-                    x="magnitude", 
-                    nbins=30,
-                    title="Magnitude Distribution",
-                    labels={'magnitude': 'Magnitude', 'count': 'Number of Earthquakes'}
-                )
-                st.plotly_chart(fig_hist, use_container_width=True)
+                fig_hist = build_histogram_fig(fig_key, df)
+                st.plotly_chart(fig_hist, use_container_width=True, config=PLOTLY_CONFIG)
             
             with col2:
                 # Depth vs Magnitude scatter plot
-                fig_scatter = px.scatter(
-                    df, 
-                    x="depth", 
-                    y="magnitude",
-                    hover_name="place",
-                    title="Depth vs Magnitude",
-                    labels={'depth': 'Depth (km)', 'magnitude': 'Magnitude'}
-                )
-                st.plotly_chart(fig_scatter, use_container_width=True)
+                fig_scatter = build_scatter_fig(fig_key, df)
+                st.plotly_chart(fig_scatter, use_container_width=True, config=PLOTLY_CONFIG)
             
             # Timeline
             st.subheader("Earthquake Timeline")
-            df_sorted = df.sort_values('time')
-            fig_timeline = px.scatter(
-                df_sorted, 
-                x="time", 
-                y="magnitude",
-                size="magnitude",
-                hover_name="place",
-                title="Earthquakes Over Time",
-                labels={'time': 'Time', 'magnitude': 'Magnitude'}
-            )
-            st.plotly_chart(fig_timeline, use_container_width=True)
+            fig_timeline = build_timeline_fig(fig_key, df)
+            st.plotly_chart(fig_timeline, use_container_width=True, config=PLOTLY_CONFIG)
         
-        with tab3:
+        elif active_tab == "📋 Data Table":
             st.subheader("Earthquake Data Table")
             
-            # Format the dataframe for display
-            display_df = df.copy()
-            display_df['time'] = display_df['time'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            display_df = display_df.round({'magnitude': 2, 'latitude': 4, 'longitude': 4, 'depth': 1})
-            
-            # Select columns to display
+            # Project the displayed columns; formatting is applied by column_config in the frontend
             columns_to_show = ['time', 'magnitude', 'place', 'latitude', 'longitude', 'depth', 'tsunami']
-            display_df = display_df[columns_to_show]
+            display_df = df[columns_to_show]
             
             st.dataframe(
                 display_df,
                 use_container_width=True,
                 column_config={
-                    "time": "Time (UTC)",
+                    "time": st.column_config.DatetimeColumn("Time (UTC)", format="YYYY-MM-DD HH:mm:ss"),
                     "magnitude": st.column_config.NumberColumn("Magnitude", format="%.1f"),
                     "place": "Location",
                     "latitude": st.column_config.NumberColumn("Latitude", format="%.4f"),
@@ -247,38 +501,37 @@ if earthquake_data:
             )
             
             # Download button
-            csv = display_df.to_csv(index=False)
             st.download_button(
                 label="📥 Download CSV",
-                data=csv,
+                data=_to_csv_bytes(display_df),
                 file_name=f"earthquake_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
         
-        with tab4:
+        elif active_tab == "ℹ️ Details":
             st.subheader("Earthquake Details")
             
             if not df.empty:
                 # Find the largest earthquake
-                largest_eq = df.loc[df['magnitude'].idxmax()]
+                largest_eq = df.nlargest(1, 'magnitude').iloc[0]
                 
                 st.write("**Largest Earthquake in Dataset:**")
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     st.write(f"**Magnitude:** {largest_eq['magnitude']}")
-                    st.write(f"**Location:** {largest_eq['place']}")
+                    st.write(f"**Location:** {largest_eq['place'] if pd.notna(largest_eq['place']) else None}")
                     st.write(f"**Time:** {largest_eq['time']}")
                 
                 with col2:
                     st.write(f"**Coordinates:** {largest_eq['latitude']:.3f}, {largest_eq['longitude']:.3f}")
                     st.write(f"**Depth:** {largest_eq['depth']:.1f} km")
-                    if largest_eq['url']:
+                    if pd.notna(largest_eq['url']):
                         st.write(f"**[More Info]({largest_eq['url']})**")
                 
                 # Additional statistics
                 st.subheader("Statistical Summary")
-                st.write(df[['magnitude', 'depth', 'significance']].describe())
+                st.write(build_summary_stats(fig_key, df))
                 
     else:
         st.warning("No earthquake data found for the selected criteria.")
@@ -289,4 +542,12 @@ else:
 # Footer
 st.markdown("---")
 st.markdown("Data source: [USGS Earthquake Hazards Program](https://earthquake.usgs.gov/)")
-st.markdown("*Data is updated in real-time from USGS feeds*")
\ No newline at end of file
+st.markdown("*Data is updated in real-time from USGS feeds*")
+
+# Warm the neighboring time ranges after the current view has rendered
+if earthquake_data:
+    prefetch_neighboring_periods(
+        time_options[selected_time],
+        magnitude_options[selected_magnitude],
+        max_results
+    )
\ No newline at end of file